@@ -19,3 +19,12 @@ GOB_DATABASE_CONFIG = {
 }
 
 LISTEN_TO_CATALOGS = os.getenv("LISTEN_TO_CATALOGS", "").split(",")
+
+# Number of pages of events (and their objects) to fetch ahead while the current page is being produced.
+# 0 disables prefetching.
+PREFETCH_QUEUE_DEPTH = int(os.getenv("PREFETCH_QUEUE_DEPTH", 0))
+
+# Number of worker processes that build and map event data in parallel. 0 builds in the producing process.
+BUILD_WORKERS = int(os.getenv("BUILD_WORKERS", 0))
+# Number of objects sent to a build worker at once
+BUILD_CHUNK_SIZE = int(os.getenv("BUILD_CHUNK_SIZE", 500))
@@ -1,4 +1,5 @@
 import warnings
+from typing import Iterable
 
 from sqlalchemy import MetaData, and_, create_engine
 from sqlalchemy import exc as sa_exc
@@ -115,3 +116,14 @@ class GobDatabaseConnection:
     def get_object(self, tid: str):
         """Get full object for given tid."""
         return self._query_object().filter(self.ObjectTable._tid == tid).one()
+
+    def get_objects_by_tids(self, tids: Iterable[str]) -> dict:
+        """Get full objects for the given tids in one query.
+
+        Returns a dict with the tid as key and the object as value. Duplicate tids are only queried once.
+        """
+        unique_tids = set(tids)
+        if not unique_tids:
+            return {}
+
+        return {obj._tid: obj for obj in self._query_object().filter(self.ObjectTable._tid.in_(unique_tids))}
@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from gobcore.typesystem import get_gob_type_from_info
 
 from gobeventproducer import gob_model
@@ -45,3 +47,31 @@ class EventDataBuilder:
                 result[attr_name_or_alias] = type_instance.to_value
         result["_gobid"] = getattr(obj, "_gobid")
         return result
+
+    def detach(self, obj: object) -> SimpleNamespace:
+        """Return a picklable copy of the SQLAlchemy object with only the attributes that build_event uses."""
+        values = {"_gobid": getattr(obj, "_gobid")}
+        for attr_name, attr in self.collection["fields"].items():
+            if attr["type"] == "GOB.Reference":
+                if relation := self.relations.get(attr_name):
+                    collection_name = f"{relation.relation_table_name}_collection"
+                    values[collection_name] = [
+                        self._detach_relation_row(row, relation.dst_table_name) for row in getattr(obj, collection_name)
+                    ]
+            elif attr["type"] != "GOB.ManyReference":
+                values[attr_name] = getattr(obj, attr_name)
+        return SimpleNamespace(**values)
+
+    @staticmethod
+    def _detach_relation_row(row: object, dst_table_name: str) -> SimpleNamespace:
+        dst = None
+        if (dst_table := getattr(row, dst_table_name)) is not None:
+            dst = SimpleNamespace(_tid=dst_table._tid, _id=dst_table._id)
+            if hasattr(dst_table, "volgnummer"):
+                dst.volgnummer = dst_table.volgnummer
+
+        return SimpleNamespace(
+            begin_geldigheid=row.begin_geldigheid,
+            eind_geldigheid=row.eind_geldigheid,
+            **{dst_table_name: dst},
+        )
@@ -0,0 +1,87 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Iterable, Iterator, Optional, TypeVar
+
+from more_itertools import chunked
+
+from gobeventproducer.eventbuilder import EventDataBuilder
+
+T = TypeVar("T")
+
+# Builder and mapper of the worker process, set by _init_worker
+_worker_builder: Optional[EventDataBuilder] = None
+_worker_mapper: Any = None
+
+
+def _init_worker(catalogue: str, collection: str, mapper: Any) -> None:
+    global _worker_builder, _worker_mapper
+
+    _worker_builder = EventDataBuilder(catalogue, collection)
+    _worker_mapper = mapper
+
+
+def _build_and_map(objs: list[Any]) -> list[dict[str, Any]]:
+    assert _worker_builder is not None, "Worker is not initialised"
+    return [_worker_mapper.map(_worker_builder.build_event(obj)) for obj in objs]
+
+
+class ParallelEventDataBuilder:
+    """Build and map event data in a pool of worker processes.
+
+    Objects are sent to the workers in chunks. The results are returned in the same order as the objects were
+    passed in, so callers can rely on the order of the events (e.g. for the first/last of sequence markers and the
+    last sent event id). At most two chunks per worker are in flight, to bound memory usage.
+    """
+
+    def __init__(self, catalogue: str, collection: str, mapper: Any, workers: int, chunk_size: int):
+        self.catalogue = catalogue
+        self.collection = collection
+        self.mapper = mapper
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.event_builder = EventDataBuilder(catalogue, collection)
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelEventDataBuilder":
+        """Enter context, start the worker processes."""
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.catalogue, self.collection, self.mapper),
+        )
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Exit context, stop the worker processes."""
+        assert self.executor is not None
+        self.executor.shutdown(cancel_futures=True)
+        self.executor = None
+
+    def _submit(self, chunk: list[tuple[T, Any]]) -> "Future[list[dict[str, Any]]]":
+        assert self.executor is not None, "Use ParallelEventDataBuilder as context manager"
+        return self.executor.submit(_build_and_map, [self.event_builder.detach(obj) for _, obj in chunk])
+
+    def build(self, items: Iterable[tuple[T, Any]]) -> Iterator[tuple[T, dict[str, Any]]]:
+        """Build and map the objects in items.
+
+        Items are (key, object) tuples. Yields (key, mapped data) tuples in the order of items.
+        """
+        pending: deque[tuple[list[tuple[T, Any]], "Future[list[dict[str, Any]]]"]] = deque()
+
+        for chunk in chunked(items, self.chunk_size):
+            pending.append((chunk, self._submit(chunk)))
+
+            if len(pending) > 2 * self.workers:
+                yield from self._collect(*pending.popleft())
+
+        while pending:
+            yield from self._collect(*pending.popleft())
+
+    @staticmethod
+    def _collect(
+        chunk: list[tuple[T, Any]], future: "Future[list[dict[str, Any]]]"
+    ) -> Iterator[tuple[T, dict[str, Any]]]:
+        for (key, _), data in zip(chunk, future.result()):
+            yield key, data
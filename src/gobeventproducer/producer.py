@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime
-from typing import Iterator
+from typing import Iterable, Iterator, Optional
 
 from gobcore.events.import_events import ADD
 from gobcore.message_broker.async_message_broker import AsyncConnection
@@ -10,6 +10,7 @@ from gobcore.model.relations import get_catalog_collection_relation_name
 from more_itertools import peekable
 
 from gobeventproducer import gob_model
+from gobeventproducer.config import BUILD_CHUNK_SIZE, BUILD_WORKERS, PREFETCH_QUEUE_DEPTH
 from gobeventproducer.database.gob.contextmanager import GobDatabaseConnection
 from gobeventproducer.database.local.contextmanager import LocalDatabaseConnection
 from gobeventproducer.eventbuilder import EventDataBuilder
@@ -21,6 +22,8 @@ from gobeventproducer.mapper import (
 )
 from gobeventproducer.mapping import MappingDefinitionLoader
 from gobeventproducer.naming import camel_case
+from gobeventproducer.parallel import ParallelEventDataBuilder
+from gobeventproducer.utils.prefetch import prefetch
 
 logging.getLogger("eventproducer").setLevel(logging.WARNING)
 
@@ -131,19 +134,39 @@ class EventProducer:
             }
             self.routing_key = f"{catalog}.{collection_name}"
 
-    def _build_event(self, event_action: str, event_id: int, object_tid: str, data: object, event_builder):
-        header = {
+    def _build_header(self, event_action: str, event_id: int, object_tid: str):
+        return {
             **self.header_data,
             "event_type": event_action,
             "event_id": event_id,
             "tid": object_tid,
             "generated_timestamp": datetime.now().isoformat(),
         }
+
+    def _build_event(self, event_action: str, event_id: int, object_tid: str, data: object, event_builder):
+        header = self._build_header(event_action, event_id, object_tid)
         data = event_builder.build_event(data)
         transformed_data = self.mapper.map(data)
 
         return {"header": header, "data": transformed_data}
 
+    def _build_events(self, items: Iterable[tuple[str, int, str, object]], event_builder):
+        """Build events for the (event_action, event_id, object_tid, object) tuples in items, keeping their order.
+
+        When BUILD_WORKERS is set, the event data is built and mapped in a pool of worker processes.
+        """
+        if BUILD_WORKERS <= 0:
+            for event_action, event_id, object_tid, obj in items:
+                yield self._build_event(event_action, event_id, object_tid, obj, event_builder)
+            return
+
+        with ParallelEventDataBuilder(
+            self.catalog, self.collection, self.mapper, BUILD_WORKERS, BUILD_CHUNK_SIZE
+        ) as parallel_builder:
+            keyed_objects = ((item[:3], item[3]) for item in items)
+            for (event_action, event_id, object_tid), data in parallel_builder.build(keyed_objects):
+                yield {"header": self._build_header(event_action, event_id, object_tid), "data": data}
+
     def _produce(self, events: Iterator):
         with AsyncConnection(CONNECTION_PARAMS) as rabbitconn, LocalDatabaseConnection(
             self.catalog, self.collection
@@ -157,25 +180,36 @@ class EventProducer:
                 self.logger.info(f"Produced {batch_builder.cnt} events.")
                 return batch_builder.cnt
 
+    def _get_event_pages(self, gobdb: GobDatabaseConnection, min_eventid: int, max_eventid: Optional[int]):
+        """Yield pages of (event, object) tuples for the events after min_eventid until max_eventid (inclusive)."""
+        start_eventid = min_eventid
+        while True:
+            events_ = list(gobdb.get_events(start_eventid, max_eventid, MAX_EVENTS_PER_MESSAGE))
+
+            if not events_:
+                break
+
+            # Load all objects for this page at once. A tid may occur multiple times in one page.
+            objects = gobdb.get_objects_by_tids(event_.tid for event_ in events_)
+
+            for event_ in events_:
+                gobdb.session.expunge(event_)
+
+            yield [(event_, objects[event_.tid]) for event_ in events_]
+
+            start_eventid = events_[-1].eventid
+
     def _generate_by_eventids(self, min_eventid: int, max_eventid: int = None):
         event_builder = EventDataBuilder(self.catalog, self.collection)
         with GobDatabaseConnection(self.catalog, self.collection, self.logger) as gobdb:
-            current_max_id = None
-            start_eventid = min_eventid
-            while True:
-                events_ = gobdb.get_events(start_eventid, max_eventid, MAX_EVENTS_PER_MESSAGE)
-
-                for event_ in events_:
-                    obj = gobdb.get_object(event_.tid)
-                    external_event = self._build_event(event_.action, event_.eventid, event_.tid, obj, event_builder)
-                    yield external_event
-                    current_max_id = event_.eventid
-                    gobdb.session.expunge(event_)
+            pages = self._get_event_pages(gobdb, min_eventid, max_eventid)
 
-                if current_max_id is None or current_max_id == start_eventid:
-                    break
+            if PREFETCH_QUEUE_DEPTH > 0:
+                # Fetch the next pages from the GOB database while the current page is built and published
+                pages = prefetch(pages, PREFETCH_QUEUE_DEPTH)
 
-                start_eventid = current_max_id
+            items = ((event_.action, event_.eventid, event_.tid, obj) for page in pages for event_, obj in page)
+            yield from self._build_events(items, event_builder)
 
     def produce(self, min_eventid: int = None, max_eventid: int = None):
         """Produce external events starting from min_eventid (exclusive) until max_eventid (inclusive)."""
@@ -213,21 +247,22 @@ class EventProducer:
         """
         with GobDatabaseConnection(self.catalog, self.collection, self.logger) as gobdb:
             event_builder = EventDataBuilder(self.catalog, self.collection)
-            objects = peekable(gobdb.get_objects())
+            objects = gobdb.get_objects()
 
             self.logger.info(
                 f"Start generating ADD events for current database state " f"using routing key {self.routing_key}"
             )
 
-            def event_generator(objects_: list):
-                first_of_sequence = True
-                for obj in objects_:
-                    external_event = self._build_event(ADD.name, obj._last_event, obj._tid, obj, event_builder)
+            def event_generator(objects_: Iterable):
+                items = ((ADD.name, obj._last_event, obj._tid, obj) for obj in objects_)
+                events = peekable(self._build_events(items, event_builder))
 
+                first_of_sequence = True
+                for external_event in events:
                     external_event["header"] |= {
                         "full_load_sequence": True,
                         "first_of_sequence": first_of_sequence,
-                        "last_of_sequence": False if objects.peek(None) else True,
+                        "last_of_sequence": False if events.peek(None) else True,
                     }
                     first_of_sequence = False
                     yield external_event
@@ -0,0 +1,65 @@
+import queue
+import threading
+from typing import Any, Generic, Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    """Wraps an exception raised in the background thread, to be re-raised in the consuming thread."""
+
+    def __init__(self, exception: Exception):
+        self.exception = exception
+
+
+class Prefetcher(Generic[T]):
+    """Iterate over iterable in a background thread, keeping at most depth items ahead of the consumer.
+
+    Exceptions raised while iterating are re-raised in the consuming thread. When the consumer stops early, the
+    background thread is stopped as soon as it tries to hand over its next item.
+    """
+
+    def __init__(self, iterable: Iterable[T], depth: int):
+        self.iterable = iterable
+        self.items: "queue.Queue[Any]" = queue.Queue(maxsize=depth)
+        self.stopped = threading.Event()
+
+    def _put(self, item: Any) -> bool:
+        while not self.stopped.is_set():
+            try:
+                self.items.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _fetch(self) -> None:
+        try:
+            for item in self.iterable:
+                if not self._put(item):
+                    return
+        except Exception as e:
+            self._put(_Failure(e))
+        else:
+            self._put(_DONE)
+
+    def __iter__(self) -> Iterator[T]:
+        """Start fetching in the background and yield the fetched items in order."""
+        thread = threading.Thread(target=self._fetch, name="prefetch", daemon=True)
+        thread.start()
+
+        try:
+            while (item := self.items.get()) is not _DONE:
+                if isinstance(item, _Failure):
+                    raise item.exception
+                yield item
+        finally:
+            self.stopped.set()
+            thread.join()
+
+
+def prefetch(iterable: Iterable[T], depth: int) -> Iterator[T]:
+    """Return an iterator over iterable that fetches at most depth items ahead in a background thread."""
+    return iter(Prefetcher(iterable, depth))
@@ -167,6 +167,25 @@ class TestGobDatabaseConnection(TestCase):
         gdc._query_object.return_value.filter.assert_called_with("_tid == 24")
         self.assertEqual(res, gdc._query_object.return_value.filter.return_value.one.return_value)
 
+    def test_get_objects_by_tids(self):
+        gdc = GobDatabaseConnection("cat", "coll", MagicMock())
+        gdc._query_object = MagicMock()
+        gdc.ObjectTable = MagicMock()
+
+        obj_a = type("DbObject", (), {"_tid": "a"})
+        obj_b = type("DbObject", (), {"_tid": "b"})
+        gdc._query_object.return_value.filter.return_value = [obj_a, obj_b]
+
+        res = gdc.get_objects_by_tids(["a", "b", "a"])
+        gdc.ObjectTable._tid.in_.assert_called_with({"a", "b"})
+        gdc._query_object.return_value.filter.assert_called_with(gdc.ObjectTable._tid.in_.return_value)
+        self.assertEqual({"a": obj_a, "b": obj_b}, res)
+
+        # No tids, no query
+        gdc._query_object.reset_mock()
+        self.assertEqual({}, gdc.get_objects_by_tids([]))
+        gdc._query_object.assert_not_called()
+
     @patch("gobeventproducer.database.gob.contextmanager.gob_model", spec_set=True)
     @patch("gobeventproducer.database.gob.contextmanager.MetaData")
     @patch("gobeventproducer.database.gob.contextmanager.create_engine")
@@ -1,3 +1,4 @@
+import pickle
 from datetime import datetime
 from unittest import TestCase
 from unittest.mock import patch
@@ -106,6 +107,10 @@ class TestEventDataBuilder(TestCase):
 
         self.assertEqual(expected, edb.build_event(dbobject))
 
+        # A detached copy survives pickling and builds the same event data
+        detached = pickle.loads(pickle.dumps(edb.detach(dbobject)))
+        self.assertEqual(expected, edb.build_event(detached))
+
         # Test empty relations
         dbobject.rel_tst_rta_tst_rtc_ref_to_c_collection = []
         dbobject.rel_tst_rta_tst_rtc_manyref_to_c_collection = []
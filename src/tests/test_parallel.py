@@ -0,0 +1,73 @@
+from concurrent.futures import Future
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from gobeventproducer import parallel
+from gobeventproducer.parallel import ParallelEventDataBuilder, _build_and_map, _init_worker
+
+
+class MockEventDataBuilder:
+    def __init__(self, catalogue, collection):
+        self.catalogue = catalogue
+        self.collection = collection
+
+    def build_event(self, obj):
+        return {"value": obj}
+
+    def detach(self, obj):
+        return f"detached {obj}"
+
+
+class MockMapper:
+    def map(self, data):
+        return {"mapped": data["value"]}
+
+
+class InProcessExecutor:
+    """Runs submitted work directly, in the calling process."""
+
+    def __init__(self, max_workers, mp_context, initializer, initargs):
+        self.max_workers = max_workers
+        initializer(*initargs)
+        self.submitted = 0
+        self.shutdown = MagicMock()
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@patch("gobeventproducer.parallel.EventDataBuilder", MockEventDataBuilder)
+class TestParallel(TestCase):
+    def test_init_worker_build_and_map(self):
+        _init_worker("cat", "coll", MockMapper())
+
+        self.assertEqual("cat", parallel._worker_builder.catalogue)
+        self.assertEqual("coll", parallel._worker_builder.collection)
+        self.assertEqual([{"mapped": 1}, {"mapped": 2}], _build_and_map([1, 2]))
+
+    @patch("gobeventproducer.parallel.ProcessPoolExecutor", InProcessExecutor)
+    def test_build(self):
+        items = [(f"key{i}", i) for i in range(7)]
+
+        with ParallelEventDataBuilder("cat", "coll", MockMapper(), 1, 2) as builder:
+            executor = builder.executor
+            self.assertEqual(1, executor.max_workers)
+
+            result = list(builder.build(iter(items)))
+
+        self.assertEqual([(f"key{i}", {"mapped": f"detached {i}"}) for i in range(7)], result)
+        self.assertEqual(4, executor.submitted)
+        executor.shutdown.assert_called_with(cancel_futures=True)
+        self.assertIsNone(builder.executor)
+
+    @patch("gobeventproducer.parallel.ProcessPoolExecutor", InProcessExecutor)
+    def test_build_bounded_in_flight(self):
+        with ParallelEventDataBuilder("cat", "coll", MockMapper(), 1, 1) as builder:
+            result = builder.build((i, i) for i in range(10))
+
+            # At most two chunks per worker are in flight before the first result is collected
+            self.assertEqual((0, {"mapped": "detached 0"}), next(result))
+            self.assertEqual(3, builder.executor.submitted)
@@ -179,11 +179,11 @@ class TestEventProducer(TestCase):
             []
         ])
         gobdb_instance.get_events = MagicMock(side_effect=mock_events)
-        gobdb_instance.get_object = MagicMock(side_effect=lambda tid: type('DbObject', (), {
+        gobdb_instance.get_objects_by_tids = MagicMock(side_effect=lambda tids: {tid: type('DbObject', (), {
             "some": "data",
             "int": 8042,
             "_gobid": tid,  # Of course not the same thing, but for the purpose of testing.
-        }))
+        }) for tid in tids})
 
         p = EventProducer("cat", "coll", MagicMock())
         p.gob_db_session = MagicMock()
@@ -229,7 +229,7 @@ class TestEventProducer(TestCase):
             }]),
         ])
 
-        gobdb_instance.get_object.assert_has_calls([call(event.tid) for event in mock_events])
+        self.assertEqual(2, gobdb_instance.get_objects_by_tids.call_count)
         gobdb_instance.session.expunge.assert_has_calls([call(event) for event in mock_events])
         localdb_instance.set_last_eventid.assert_has_calls([call(105)])
         p.logger.warning.assert_not_called()
@@ -257,6 +257,38 @@ class TestEventProducer(TestCase):
         p.logger.info.assert_any_call("No min_eventid specified. Starting from last_eventid (100)")
         gobdb_instance.get_events.assert_called_with(100, None, 200)
 
+    @patch("gobeventproducer.producer.PREFETCH_QUEUE_DEPTH", 1)
+    @patch("gobeventproducer.producer.EventDataBuilder", MockEventDatabuilder)
+    @patch("gobeventproducer.producer.gob_model", mock_model)
+    @patch("gobeventproducer.eventbuilder.gob_model", mock_model)
+    @patch("gobeventproducer.producer.LocalDatabaseConnection")
+    @patch("gobeventproducer.producer.GobDatabaseConnection")
+    @patch("gobeventproducer.producer.AsyncConnection")
+    def test_produce_prefetch(self, mock_rabbit, mock_gobdb, mock_localdb):
+        rabbit_instance = mock_rabbit.return_value.__enter__.return_value
+        localdb_instance = mock_localdb.return_value.__enter__.return_value
+        gobdb_instance = mock_gobdb.return_value.__enter__.return_value
+
+        gobdb_instance.get_events = MagicMock(side_effect=iter([
+            [MockEvent(101, "ADD", 200), MockEvent(102, "MODIFY", 200)],
+            [MockEvent(105, "MODIFY", 201)],
+            [],
+        ]))
+        gobdb_instance.get_objects_by_tids = MagicMock(side_effect=lambda tids: {tid: type('DbObject', (), {
+            "some": "data",
+            "int": 8042,
+            "_gobid": tid,
+        }) for tid in tids})
+        localdb_instance.get_last_eventid = MagicMock(return_value=100)
+
+        p = EventProducer("cat", "coll", MagicMock())
+        self.assertEqual(3, p.produce(100, 200))
+
+        published = rabbit_instance.publish.call_args[0][2]
+        self.assertEqual([101, 102, 105], [event["header"]["event_id"] for event in published])
+        self.assertEqual([200, 200, 201], [event["data"]["_gobid"] for event in published])
+        localdb_instance.set_last_eventid.assert_called_with(105)
+
     @patch("gobeventproducer.producer.EventDataBuilder", MockEventDatabuilder)
     @patch("gobeventproducer.producer.MAX_EVENTS_PER_MESSAGE", 2)
     @patch("gobeventproducer.producer.gob_model", mock_model)
@@ -0,0 +1,48 @@
+import threading
+from unittest import TestCase
+
+from gobeventproducer.utils.prefetch import prefetch
+
+
+class TestPrefetch(TestCase):
+    def test_prefetch(self):
+        self.assertEqual([1, 2, 3, 4], list(prefetch(iter([1, 2, 3, 4]), 2)))
+        self.assertEqual([], list(prefetch([], 2)))
+
+    def test_prefetch_runs_in_background(self):
+        threads = []
+
+        def items():
+            for i in range(3):
+                threads.append(threading.current_thread())
+                yield i
+
+        self.assertEqual([0, 1, 2], list(prefetch(items(), 1)))
+        self.assertTrue(all(thread is not threading.current_thread() for thread in threads))
+
+    def test_prefetch_exception(self):
+        def items():
+            yield 1
+            raise ValueError("Failed fetching")
+
+        result = []
+        with self.assertRaisesRegex(ValueError, "Failed fetching"):
+            for item in prefetch(items(), 2):
+                result.append(item)
+
+        self.assertEqual([1], result)
+
+    def test_prefetch_stop_early(self):
+        fetched = []
+
+        def items():
+            for i in range(100):
+                fetched.append(i)
+                yield i
+
+        it = prefetch(items(), 1)
+        self.assertEqual(0, next(it))
+        it.close()
+
+        # Fetching stopped well before the end of the iterable
+        self.assertLess(len(fetched), 100)